@@ -1,5 +1,9 @@
+import heapq # For lazily merging sorted runs in the out-of-core mode.
+from collections import Counter # For counting occurrences of each number.
 import logging # For logging events.
+import numpy as np # For numerical operations and array manipulations.
 import os # Provides a way to interact with the operating system, such as file and directory operations.
+import tempfile # For temporary storage of sorted runs in the out-of-core mode.
 
 logging.getLogger('urllib3').setLevel(logging.INFO) # Set up logging events.
 
@@ -40,6 +44,88 @@ def part1(lst1, lst2):
 
     return total_distance # Return the calculated total distance.
 
+def part1_sorted(lst1, lst2):
+    """
+    Computes the total distance by pairing both lists in sorted order.
+
+    :param lst1: List (or array) of integers from the first column.
+    :param lst2: List (or array) of integers from the second column.
+    :return: Total distance between the sorted pairs.
+    """
+    arr1 = np.sort(np.asarray(lst1, dtype=np.int64)) # Sort the first column as int64.
+    arr2 = np.sort(np.asarray(lst2, dtype=np.int64)) # Sort the second column as int64.
+    return int(np.abs(arr1 - arr2).sum()) # Sum the absolute differences of the sorted pairs.
+
+def write_sorted_runs(filename, chunk_size, tmp_dir):
+    """
+    Reads the file in chunks, sorts each chunk per column and stores it as a run on disk.
+
+    :param filename: Name of the file to read.
+    :param chunk_size: Maximum number of lines held in memory at once.
+    :param tmp_dir: Directory where the sorted runs are written.
+    :return: Two lists of run file paths, one per column.
+    """
+    runs1, runs2 = [], [] # Paths of the sorted runs for each column.
+
+    def flush(clm1, clm2):
+        index = len(runs1) # Number of the run being written.
+        for clm, runs, name in ((clm1, runs1, "left"), (clm2, runs2, "right")):
+            path = os.path.join(tmp_dir, f"{name}_{index}.npy") # Path of the run file.
+            np.save(path, np.sort(np.asarray(clm, dtype=np.int64))) # Store the sorted chunk.
+            runs.append(path)
+
+    clm1, clm2 = [], [] # Values of the current chunk.
+    with open(filename, "r") as file: # Open the file in read mode.
+        for line in file:
+            if not line.strip(): # Skip empty lines.
+                continue
+            value1, value2 = map(int, line.split()) # Convert both columns to integers.
+            clm1.append(value1)
+            clm2.append(value2)
+            if len(clm1) >= chunk_size: # The chunk is full, write it as a run.
+                flush(clm1, clm2)
+                clm1, clm2 = [], []
+    if clm1: # Write the last partial chunk.
+        flush(clm1, clm2)
+
+    return runs1, runs2 # Return the run paths for both columns.
+
+def iter_run(path, block_size):
+    """
+    Yields the values of one sorted run, reading it from disk block by block.
+    """
+    run = np.load(path, mmap_mode="r") # Memory-map the run instead of loading it.
+    for start in range(0, len(run), block_size):
+        yield from run[start:start + block_size].tolist() # Convert one block to Python ints.
+
+def part1_external(filename, chunk_size=1_000_000, block_size=65_536):
+    """
+    Computes the total distance for inputs that do not fit in memory using an external merge sort.
+
+    :param filename: Name of the file to read.
+    :param chunk_size: Number of lines sorted in memory per run.
+    :param block_size: Number of merged pairs accumulated before summing their distances.
+    :return: Total distance between the sorted pairs.
+    """
+    total_distance = 0 # Initialize the total distance to 0.
+
+    with tempfile.TemporaryDirectory() as tmp_dir: # Runs are removed once the merge is done.
+        runs1, runs2 = write_sorted_runs(filename, chunk_size, tmp_dir)
+        merged1 = heapq.merge(*(iter_run(path, block_size) for path in runs1)) # Sorted first column.
+        merged2 = heapq.merge(*(iter_run(path, block_size) for path in runs2)) # Sorted second column.
+
+        block1, block2 = [], [] # Merged pairs waiting to be summed.
+        for value1, value2 in zip(merged1, merged2):
+            block1.append(value1)
+            block2.append(value2)
+            if len(block1) >= block_size: # Sum the distances of a full block at once.
+                total_distance += int(np.abs(np.array(block1, dtype=np.int64) - np.array(block2, dtype=np.int64)).sum())
+                block1, block2 = [], []
+        if block1: # Sum the distances of the last partial block.
+            total_distance += int(np.abs(np.array(block1, dtype=np.int64) - np.array(block2, dtype=np.int64)).sum())
+
+    return total_distance # Return the calculated total distance.
+
 def part2(lst1, lst2):
     similarity_score = 0 # Initialize the similarity score to 0.
 
@@ -49,11 +135,60 @@ def part2(lst1, lst2):
 
     return similarity_score # Return the calculated similarity score.
 
+class SimilarityIndex:
+    """
+    Keeps the similarity score up to date while numbers are added to or removed from either list.
+
+    Each number contributes number * (count in lst1) * (count in lst2) to the score, so a single
+    update only changes the score by number * (count of that number in the other list).
+    """
+
+    def __init__(self, lst1=(), lst2=()):
+        self.left = Counter(lst1) # Occurrences of each number in the first list.
+        self.right = Counter(lst2) # Occurrences of each number in the second list.
+        self.score = sum(number * count * self.right[number] for number, count in self.left.items()) # Initial score.
+
+    def add(self, number, side):
+        """
+        Adds one occurrence of number to the given side ("left" or "right").
+        """
+        counts, other = self._sides(side)
+        counts[number] += 1 # Record the new occurrence.
+        self.score += number * other[number] # Pair it with every occurrence on the other side.
+
+    def remove(self, number, side):
+        """
+        Removes one occurrence of number from the given side ("left" or "right").
+        """
+        counts, other = self._sides(side)
+        if counts[number] == 0:
+            raise ValueError(f"{number} is not present on the {side} side.")
+        counts[number] -= 1 # Drop one occurrence.
+        if counts[number] == 0:
+            del counts[number] # Keep the counter free of zero entries.
+        self.score -= number * other[number] # Remove its pairings with the other side.
+
+    def _sides(self, side):
+        if side == "left":
+            return self.left, self.right
+        if side == "right":
+            return self.right, self.left
+        raise ValueError(f"Unknown side: {side}")
+
+def part2_indexed(lst1, lst2):
+    """
+    Computes the similarity score in linear time using a frequency index of both lists.
+
+    :param lst1: List of integers from the first column.
+    :param lst2: List of integers from the second column.
+    :return: Similarity score.
+    """
+    return SimilarityIndex(lst1, lst2).score # Return the score of the freshly built index.
+
 filename_path = os.path.join(__location__, 'day1.txt') # Define the filename using the script's location.
 
 lst1, lst2 = read_file(filename_path) # Read the file.
-result1 = part1(lst1, lst2) # Compute the total distance using part1.
-lst1, lst2 = read_file(filename_path) # Re-read the file to reset lst1 and lst2 for part2.
-result2 = part2(lst1, lst2) # Compute the similarity score using part2. 
+result1 = part1_sorted(lst1, lst2) # Compute the total distance using the sorted pairing.
+result2 = part2_indexed(lst1, lst2) # Compute the similarity score using the frequency index.
 logging.info(f"Total distance: {result1}") # Output the total distance.
 logging.info(f"Similarity score: {result2}") # Output the similarity score. 
\ No newline at end of file
@@ -79,9 +79,87 @@ def safe_reports(reports):
 
     return safe_reports_without_changes, safe_reports_with_changes # Return the counts.
 
+def pack_reports(reports):
+    """
+    Packs ragged reports into one flat array with offsets.
+
+    :param reports: List of lists of integers (reports).
+    :return: Tuple of the flat int64 array of levels and the int64 offsets array, where report r
+             occupies values[offsets[r]:offsets[r + 1]].
+    """
+    lengths = np.fromiter((len(report) for report in reports), dtype=np.int64, count=len(reports)) # Length of each report.
+    offsets = np.zeros(len(reports) + 1, dtype=np.int64) # Start of each report in the flat array.
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.fromiter((level for report in reports for level in report), dtype=np.int64, count=int(offsets[-1])) # All levels in order.
+    return values, offsets # Return the packed reports.
+
+def report_safety_masks(values, offsets):
+    """
+    Checks every packed report at once, with and without removing a single level.
+
+    A level can be removed if the diffs before it and after it are all valid and, for inner levels,
+    the diff bridging its two neighbours is valid too. Prefix/suffix validity is read from cumulative
+    counts of invalid diffs, so each report costs linear time.
+
+    :param values: Flat int64 array of levels (see pack_reports).
+    :param offsets: int64 offsets array (see pack_reports).
+    :return: Tuple of boolean arrays (safe without changes, safe with at most one removal), one entry per report.
+    """
+    n_reports = len(offsets) - 1
+    starts, ends = offsets[:-1], offsets[1:] # Flat bounds of each report.
+    if len(values) == 0: # Only empty reports, which are trivially safe.
+        safe = np.ones(n_reports, dtype=bool)
+        return safe, safe.copy()
+
+    diffs = np.diff(values) # Diff j compares values[j] and values[j + 1]; diffs across report boundaries are never read.
+    lengths = ends - starts
+    report_ids = np.repeat(np.arange(n_reports), lengths) # Report of every level.
+    positions = np.arange(len(values)) # Flat index of every level.
+    level_starts, level_ends = starts[report_ids], ends[report_ids] # Bounds of the report of every level.
+
+    # Bridging diff over each level (values[p + 1] - values[p - 1]), only meaningful for inner levels.
+    inner = (positions > level_starts) & (positions < level_ends - 1)
+    bridge = values[np.minimum(positions + 1, len(values) - 1)] - values[np.maximum(positions - 1, 0)]
+
+    safe = np.zeros(n_reports, dtype=bool) # Safe without changes.
+    safe_with_removal = np.zeros(n_reports, dtype=bool) # Safe after removing at most one level.
+
+    for low, high in ((1, 3), (-3, -1)): # Increasing and decreasing reports.
+        bad = (diffs < low) | (diffs > high) # Invalid steps.
+        bad_before = np.zeros(len(values), dtype=np.int64) # bad_before[j] = number of invalid diffs with index < j.
+        np.cumsum(bad, out=bad_before[1:])
+
+        # Whole report: diffs starts..ends-2; empty reports at the end start at len(values), so the lookups are clamped.
+        last = len(values) - 1
+        safe |= bad_before[np.minimum(np.maximum(ends - 1, starts), last)] - bad_before[np.minimum(starts, last)] == 0
+
+        # Removing level p: diffs starts..p-2, diffs p+1..ends-2 and the bridge must all be valid.
+        prefix_ok = bad_before[np.maximum(positions - 1, level_starts)] - bad_before[level_starts] == 0
+        suffix_ok = bad_before[level_ends - 1] - bad_before[np.minimum(positions + 1, level_ends - 1)] == 0
+        bridge_ok = ~inner | ((bridge >= low) & (bridge <= high))
+        removable = prefix_ok & suffix_ok & bridge_ok
+        safe_with_removal |= np.bincount(report_ids, weights=removable, minlength=n_reports) > 0
+
+    return safe, safe | safe_with_removal # Return both masks.
+
+def safe_reports_batched(reports):
+    """
+    Batched version of safe_reports that checks all reports in one vectorized pass.
+
+    :param reports: List of lists of integers (reports).
+    :return: Tuple containing counts of safe reports without changes and with changes.
+
+    Empty reports (blank lines) are safe, including a trailing one:
+
+    >>> safe_reports_batched([[1, 2, 3], []])
+    (2, 2)
+    """
+    safe, safe_with_changes = report_safety_masks(*pack_reports(reports))
+    return int(safe.sum()), int(safe_with_changes.sum()) # Return the counts.
+
 filename_path = os.path.join(__location__, 'day2.txt') # Define the filename using the script's location.
 
 data = read_file(filename_path) # Read the input data from the specified file.
-safe_reports_without_changes, safe_reports_with_changes = safe_reports(data)  # Determine safe reports.
+safe_reports_without_changes, safe_reports_with_changes = safe_reports_batched(data)  # Determine safe reports.
 logging.info(f"Safe reports without changes: {safe_reports_without_changes}")
 logging.info(f"Safe reports (including changes): {safe_reports_with_changes}")
\ No newline at end of file
@@ -1,6 +1,9 @@
 import logging # For logging events.
+import mmap # For reading large memory dumps without loading them into a string.
 import re # ReGex module for pattern matching within the memory string.
 import os # Provides a way to interact with the operating system, such as file and directory operations.
+from concurrent.futures import ProcessPoolExecutor # For scanning file ranges in parallel.
+from functools import reduce # For folding chunk summaries into one result.
 
 logging.getLogger('urllib3').setLevel(logging.INFO) # Set up logging events.
 
@@ -73,11 +76,144 @@ def part2(memory):
 
     return total # Return the total sum of all valid 'mul(x,y)' computations. 
 
-filename_path = os.path.join(__location__, "day3.txt") # Define the filename using the script's location.
+# Byte patterns used by the streaming scanner.
+INSTRUCTION_REGEX = re.compile(rb"do\(\)|don't\(\)|mul\((\d+),(\d+)\)") # Same instructions as in part2.
+PARTIAL_REGEX = re.compile(rb"m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?") # Unfinished instruction at the end of a chunk.
 
-data = read_file(filename_path) # Read the corrupted memory data from the file.
- # Process the memory data to calculate the total sum.
-result = corrupted_memory(data)
-result2 = part2(data)
-logging.info(f"Total sum of valid mul instructions: {result}")
-logging.info(f"Total sum of enabled mul instructions: {result2}")
\ No newline at end of file
+# A chunk summary is a tuple (enabled_sum, disabled_sum, first_toggle, last_state):
+# - enabled_sum: sum of the chunk's enabled mul results if the chunk starts enabled.
+# - disabled_sum: the same sum if the chunk starts disabled.
+# - first_toggle: True/False for the first do()/don't() in the chunk, None if there is none.
+# - last_state: True/False for the last do()/don't() in the chunk, None if there is none.
+EMPTY_SUMMARY = (0, 0, None, None)
+
+def summarize_matches(matches):
+    """
+    Builds the summary of a chunk from its instruction matches.
+
+    :param matches: Iterable of INSTRUCTION_REGEX match objects, in file order.
+    :return: Chunk summary tuple.
+    """
+    sums = {True: 0, False: 0} # Running sum for each possible starting state.
+    states = {True: True, False: False} # Current state for each possible starting state.
+    first_toggle = None
+    last_state = None
+
+    for match in matches:
+        instruction = match.group(0)
+        if instruction == b"do()" or instruction == b"don't()": # Handle enabling and disabling.
+            last_state = instruction == b"do()"
+            if first_toggle is None:
+                first_toggle = last_state
+            states[True] = states[False] = last_state # After a toggle, both cases agree.
+        else: # This must be a 'mul(x, y)' instruction.
+            result = int(match.group(1)) * int(match.group(2))
+            for start_state in (True, False):
+                if states[start_state]:
+                    sums[start_state] += result
+
+    return sums[True], sums[False], first_toggle, last_state
+
+def combine_summaries(left, right):
+    """
+    Combines the summaries of two adjacent chunks; the operation is associative.
+    """
+    left_enabled, left_disabled, left_first, left_last = left
+    right_enabled, right_disabled, right_first, right_last = right
+
+    after_enabled = left_last if left_last is not None else True # State entering the right chunk if the left one started enabled.
+    after_disabled = left_last if left_last is not None else False # State entering the right chunk if the left one started disabled.
+
+    return (
+        left_enabled + (right_enabled if after_enabled else right_disabled),
+        left_disabled + (right_enabled if after_disabled else right_disabled),
+        left_first if left_first is not None else right_first,
+        right_last if right_last is not None else left_last,
+    )
+
+def scan_stream(filename, chunk_size=64 * 1024 * 1024):
+    """
+    Computes the part2 result by reading the file through mmap in fixed-size chunks.
+    An unfinished instruction at the end of a chunk is carried over to the next one.
+
+    :param filename: Name of the file to read.
+    :param chunk_size: Number of bytes read per chunk.
+    :return: Total sum of the enabled 'mul(x,y)' computations.
+    """
+    if os.path.getsize(filename) == 0: # mmap cannot map an empty file.
+        return 0
+
+    summary = EMPTY_SUMMARY
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+        carry = b"" # Unfinished instruction from the previous chunk.
+        for offset in range(0, len(memory), chunk_size):
+            buffer = carry + memory[offset:offset + chunk_size]
+            is_last = offset + chunk_size >= len(memory)
+
+            # Only the last 'm' or 'd' can start an unfinished instruction, as no instruction contains another one.
+            cut = len(buffer)
+            tail = max(buffer.rfind(b"m"), buffer.rfind(b"d"))
+            if not is_last and tail >= 0 and PARTIAL_REGEX.fullmatch(buffer, tail):
+                cut = tail
+
+            matches = INSTRUCTION_REGEX.finditer(buffer, 0, cut)
+            summary = combine_summaries(summary, summarize_matches(matches))
+            carry = buffer[cut:]
+
+    return summary[0] # The memory starts with mul instructions enabled.
+
+def scan_range(task):
+    """
+    Summarizes the instructions starting in the byte range [start, end) of the file.
+    Only the bytes of the range are scanned; the single instruction that may start in the range
+    and run past end is completed with one match at the last 'm' or 'd' before end.
+
+    :param task: Tuple (filename, start, end).
+    :return: Chunk summary tuple.
+    """
+    filename, start, end = task
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+        matches = list(INSTRUCTION_REGEX.finditer(memory, start, end))
+
+        # Only the last 'm' or 'd' can start an unfinished instruction, as no instruction contains another one.
+        tail = max(memory.rfind(b"m", start, end), memory.rfind(b"d", start, end))
+        if tail >= 0 and PARTIAL_REGEX.fullmatch(memory, tail, end):
+            crossing = INSTRUCTION_REGEX.match(memory, tail) # Read past end to finish the instruction.
+            if crossing:
+                matches.append(crossing)
+
+        return summarize_matches(matches)
+
+def scan_parallel(filename, workers=None, chunk_size=64 * 1024 * 1024):
+    """
+    Computes the part2 result by scanning byte ranges of the file in a process pool
+    and combining the chunk summaries in file order.
+
+    :param filename: Name of the file to read.
+    :param workers: Number of worker processes (defaults to the number of CPUs).
+    :param chunk_size: Number of bytes per range.
+    :return: Total sum of the enabled 'mul(x,y)' computations.
+    """
+    size = os.path.getsize(filename)
+    if size == 0: # mmap cannot map an empty file.
+        return 0
+
+    tasks = [(filename, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = executor.map(scan_range, tasks) # Results come back in file order.
+        summary = reduce(combine_summaries, summaries, EMPTY_SUMMARY)
+
+    return summary[0] # The memory starts with mul instructions enabled.
+
+def main():
+    filename_path = os.path.join(__location__, "day3.txt") # Define the filename using the script's location.
+
+    data = read_file(filename_path) # Read the corrupted memory data from the file.
+    # Process the memory data to calculate the total sum.
+    result = corrupted_memory(data)
+    result2 = scan_stream(filename_path)
+    logging.info(f"Total sum of valid mul instructions: {result}")
+    logging.info(f"Total sum of enabled mul instructions: {result2}")
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import logging # For logging events.
+from collections import deque # For the breadth-first construction of the automaton.
+import numpy as np # For numerical operations and array manipulations.
 import re # ReGex module for pattern matching within the memory string. 
 import os # Provides a way to interact with the operating system, such as file and directory opreations.
 
@@ -25,6 +27,147 @@ def read_file(filename):
             array2D.append(list(line.strip()))
         return array2D # Return the file content.
 
+def read_grid(filename):
+    """
+    Reads the letter grid from a file as a 2D uint8 array of byte values.
+
+    :param filename: Name of the file to read.
+    :return: 2D uint8 NumPy array, one row per line.
+    """
+    with open(filename, "rb") as file: # Open the file in binary mode.
+        lines = [line.strip() for line in file if line.strip()] # Keep non-empty lines without line endings.
+    return np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(len(lines), -1) # Stack the lines into a grid.
+
+def to_grid(matrix):
+    """
+    Converts a matrix returned by read_file (list of lists of characters) to a 2D uint8 array.
+    """
+    if isinstance(matrix, np.ndarray):
+        return matrix
+    return np.array([[ord(char) for char in row] for row in matrix], dtype=np.uint8).reshape(len(matrix), -1)
+
+DIRECTIONS = [
+    (0, 1), # Right
+    (0, -1), # Left
+    (1, 0), # Down
+    (-1, 0), # Up
+    (1, 1), # Diagonal Down-Right
+    (1, -1), # Diagonal Down-Left
+    (-1, 1), # Diagonal Up-Right
+    (-1, -1) # Diagonal Up-Left
+]
+
+def ceres_search_vectorized(grid, word):
+    """
+    Counts occurrences of the word in all 8 directions using shifted-slice comparisons.
+
+    For each direction, every possible start cell is checked at once: the k-th letter of the word
+    is compared against the grid shifted by k steps in that direction.
+
+    :param grid: 2D uint8 array (see read_grid) or a matrix as returned by read_file.
+    :param word: Word to search for.
+    :return: Number of occurrences.
+    """
+    grid = to_grid(grid)
+    rows, cols = grid.shape
+    span = len(word) - 1 # Distance between the first and the last letter.
+    letters = word.encode() # Byte value of each letter.
+    occurrences = 0
+
+    for dir_x, dir_y in DIRECTIONS:
+        # Start cells from which the whole word stays inside the grid.
+        row_start, row_end = max(0, -span * dir_x), rows - max(0, span * dir_x)
+        col_start, col_end = max(0, -span * dir_y), cols - max(0, span * dir_y)
+        if row_start >= row_end or col_start >= col_end: # The word does not fit in this direction.
+            continue
+
+        matches = np.ones((row_end - row_start, col_end - col_start), dtype=bool)
+        for i, letter in enumerate(letters):
+            shifted = grid[row_start + i * dir_x:row_end + i * dir_x, col_start + i * dir_y:col_end + i * dir_y]
+            matches &= shifted == letter # Keep start cells whose i-th letter matches.
+        occurrences += int(np.count_nonzero(matches))
+
+    return occurrences
+
+def grid_lines(grid):
+    """
+    Extracts every row, column and both diagonal families of the grid as byte strings.
+
+    :param grid: 2D uint8 array.
+    :return: List of byte strings, each read in its forward direction.
+    """
+    rows, cols = grid.shape
+    flipped = np.fliplr(grid) # Anti-diagonals of the grid are the diagonals of its mirror image.
+    lines = [row.tobytes() for row in grid] # Rows (left to right).
+    lines += [col.tobytes() for col in grid.T] # Columns (top to bottom).
+    lines += [grid.diagonal(offset).tobytes() for offset in range(-rows + 1, cols)] # Diagonals (down-right).
+    lines += [flipped.diagonal(offset).tobytes() for offset in range(-rows + 1, cols)] # Anti-diagonals (down-left).
+    return lines
+
+def build_automaton(words):
+    """
+    Builds an Aho-Corasick automaton for the given words.
+
+    :param words: List of distinct words as byte strings.
+    :return: Tuple (goto, fail, output) where goto[state] maps a byte to the next state, fail[state] is the
+             failure link and output[state] lists the indexes of the words ending in that state.
+    """
+    goto = [{}] # Trie transitions, state 0 is the root.
+    output = [[]] # Words ending in each state.
+
+    for index, word in enumerate(words): # Build the trie.
+        state = 0
+        for byte in word:
+            if byte not in goto[state]:
+                goto.append({})
+                output.append([])
+                goto[state][byte] = len(goto) - 1
+            state = goto[state][byte]
+        output[state].append(index)
+
+    fail = [0] * len(goto) # Failure links, computed level by level.
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for byte, child in goto[state].items():
+            queue.append(child)
+            link = fail[state]
+            while link and byte not in goto[link]: # Follow failure links until the byte can be consumed.
+                link = fail[link]
+            fail[child] = goto[link].get(byte, 0)
+            output[child] = output[child] + output[fail[child]] # Inherit words ending at the failure state.
+
+    return goto, fail, output
+
+def ceres_search_multi(grid, words):
+    """
+    Counts occurrences of several words in all 8 directions in one pass over the grid.
+
+    Every row, column and diagonal is extracted once and scanned forward and backward with an
+    Aho-Corasick automaton, so the grid is not rescanned for each word.
+
+    :param grid: 2D uint8 array (see read_grid) or a matrix as returned by read_file.
+    :param words: Iterable of words to search for.
+    :return: Dictionary mapping each word to its number of occurrences.
+    """
+    grid = to_grid(grid)
+    unique_words = list(dict.fromkeys(words)) # Drop duplicate words, keeping their order.
+    goto, fail, output = build_automaton([word.encode() for word in unique_words])
+    counts = [0] * len(unique_words)
+
+    lines = grid_lines(grid)
+    text = b"\n".join(lines + [line[::-1] for line in lines]) # Forward and backward directions; '\n' resets the automaton.
+
+    state = 0
+    for byte in text:
+        while state and byte not in goto[state]: # Fall back until the byte can be consumed.
+            state = fail[state]
+        state = goto[state].get(byte, 0)
+        for index in output[state]:
+            counts[index] += 1
+
+    return dict(zip(unique_words, counts)) # Return the count of each word.
+
 def ceres_search(matrix, word):
     """
     Counts occurrences of the word in all 8 directions.
@@ -93,6 +236,75 @@ def find_xmas(matrix):
                 count += 1
     return count
 
+XMAS_TEMPLATE = [
+    "M.S",
+    ".A.",
+    "M.S",
+] # Two 'MAS' crossing in an X; the other orientations come from its rotations.
+
+def template_variants(template, wildcard=".", rotations=True, reflections=True):
+    """
+    Generates the distinct rotations and reflections of a 2D template.
+
+    :param template: List of equal-length strings describing the template.
+    :param wildcard: Character matching any letter.
+    :param rotations: Whether to include the 90, 180 and 270 degree rotations.
+    :param reflections: Whether to include the mirror images.
+    :return: List of distinct variants as 2D arrays of byte values, 0 marking a wildcard.
+    """
+    base = np.array([[0 if char == wildcard else ord(char) for char in row] for row in template], dtype=np.uint8)
+    candidates = [base]
+    if reflections:
+        candidates.append(np.fliplr(base))
+    if rotations:
+        candidates = [np.rot90(candidate, turns) for candidate in candidates for turns in range(4)]
+
+    variants = []
+    seen = set()
+    for candidate in candidates:
+        key = (candidate.shape, candidate.tobytes())
+        if key not in seen: # Symmetric templates produce the same variant more than once.
+            seen.add(key)
+            variants.append(np.ascontiguousarray(candidate))
+    return variants
+
+def match_stencil(grid, stencil):
+    """
+    Finds every position where a single stencil matches the grid.
+
+    :param grid: 2D uint8 array.
+    :param stencil: 2D array of byte values, 0 marking a wildcard.
+    :return: Boolean mask of top-left positions where the stencil matches.
+    """
+    rows, cols = grid.shape
+    height, width = stencil.shape
+    if height > rows or width > cols: # The stencil does not fit in the grid.
+        return np.zeros((0, 0), dtype=bool)
+
+    matches = np.ones((rows - height + 1, cols - width + 1), dtype=bool)
+    for i, j in zip(*np.nonzero(stencil)): # Only fixed cells constrain the match.
+        matches &= grid[i:i + rows - height + 1, j:j + cols - width + 1] == stencil[i, j]
+    return matches
+
+def find_template(grid, template, wildcard=".", rotations=True, reflections=True):
+    """
+    Counts matches of a 2D template with wildcards, including its rotations and reflections.
+
+    Each distinct variant is evaluated over the whole grid with boolean masks; a position matching
+    two different variants is counted once per variant.
+
+    :param grid: 2D uint8 array (see read_grid) or a matrix as returned by read_file.
+    :param template: List of equal-length strings describing the template.
+    :param wildcard: Character matching any letter.
+    :param rotations: Whether to include the rotations of the template.
+    :param reflections: Whether to include the mirror images of the template.
+    :return: Tuple (count, coordinates) where coordinates is an (n, 2) array of the top-left (row, col) of each match.
+    """
+    grid = to_grid(grid)
+    coordinates = [np.argwhere(match_stencil(grid, stencil)) for stencil in template_variants(template, wildcard, rotations, reflections)]
+    coordinates = np.concatenate(coordinates) if coordinates else np.zeros((0, 2), dtype=np.intp)
+    return len(coordinates), coordinates
+
 def main():
     filename_path = os.path.join(__location__, "day4_test.txt") # Define the filename using the script's location 
 
@@ -100,11 +312,11 @@ def main():
     matrix = read_file(filename_path) # Read the data from the file.
     
     # Count word occurrences in all directions 
-    word_count = ceres_search(matrix, word)
+    word_count = ceres_search_vectorized(matrix, word)
     logging.info(f"The word {word} occurs: {word_count} times in all directions.")
 
     # Count X-MAS patterns 
-    xmas_count = find_xmas(matrix)
+    xmas_count, _ = find_template(matrix, XMAS_TEMPLATE)
     logging.info(f"The X-MAS pattern appears: {xmas_count} times.")
 
 if __name__ == "__main__":
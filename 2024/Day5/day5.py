@@ -1,6 +1,8 @@
 import logging # For logging events.
 import os # Provides a way to interact with the operating system, such as file and directory operations.
+import sys # For reading updates from standard input.
 from collections import deque
+from functools import cmp_to_key # For sorting updates with the ordering rules as a comparator.
 
 
 logging.getLogger('urllib3').setLevel(logging.INFO) # Set up logging events.
@@ -39,6 +41,24 @@ def read_file(filename):
 
         return page_ordering, page_updates 
 
+def read_rules(filename):
+    """
+    Reads only the page ordering rules from the top of a file, stopping at the first update.
+
+    :param filename: Name of the file to read.
+    :return: List of [a, b] pairs where a must come before b.
+    """
+
+    page_ordering = []
+    with open(filename, "r") as file: # Open the file in read mode.
+        for line in file:
+            line = line.strip()
+            if ',' in line: # The updates section has started.
+                break
+            if '|' in line:
+                page_ordering.append([int(x) for x in line.split('|')])
+    return page_ordering
+
 def build_order_rules(page_ordering):
     """
     Creates a dictionary of ordering rules based on the page_ordering list.
@@ -75,10 +95,8 @@ def is_order_valid(page_ordering, update_list):
     for page in order_rules:
         if page in update_list: # Only consider pages in the update list. Example: update_list: [97, 13, 75, 29, 47]
             for after in order_rules[page]:
-                print(f"after: {after}")
                 if after in update_list:
                     in_degree[after] += 1 # Increment in-degree for pages that must come after.
-                    print(f"after2: {after}")
                     
 
     # Perform topological sort using a deque (queue).
@@ -87,9 +105,7 @@ def is_order_valid(page_ordering, update_list):
 
     while queue:
         page = queue.popleft() # Remove the first element from the queue.
-        print(f"page: {page}")
         sorted_list.append(page) # Add it to the sorted list.
-        print(f"sorted_list: {sorted_list}")
         if page in order_rules: # Check if the page has any dependencies.
             for after in order_rules[page]:
                 if after in in_degree:
@@ -102,6 +118,108 @@ def is_order_valid(page_ordering, update_list):
         return sorted_list if sorted_list != update_list else True # Return reordered list of True if already valid.
     return False # If not all pages are sorted, the order is invalid.
 
+def compile_rules(page_ordering):
+    """
+    Builds the rule index once so updates can be validated without rebuilding the rules.
+
+    Every page appearing in a rule is interned to a small integer id, and each page gets a bitset
+    (a Python int) of the ids of the pages that must come after it.
+
+    :param page_ordering: List of [a, b] pairs where a must come before b.
+    :return: A tuple (page_ids, must_follow), where:
+            - page_ids maps each page to its id.
+            - must_follow[id] is the bitset of the ids that must come after that page.
+    """
+
+    page_ids = {} # Interned page ids.
+    for a, b in page_ordering:
+        page_ids.setdefault(a, len(page_ids))
+        page_ids.setdefault(b, len(page_ids))
+
+    must_follow = [0] * len(page_ids)
+    for a, b in page_ordering:
+        must_follow[page_ids[a]] |= 1 << page_ids[b] # Record that b must come after a.
+    return page_ids, must_follow
+
+def is_update_valid(rule_index, update_list):
+    """
+    Checks if the update list respects the rules, in a single pass over the update.
+
+    :param rule_index: Tuple returned by compile_rules.
+    :param update_list: List of pages to validate.
+    :return: True if no page appears after a page that must follow it.
+    """
+
+    page_ids, must_follow = rule_index
+    seen = 0 # Bitset of the pages already printed.
+    for page in update_list:
+        page_id = page_ids.get(page)
+        if page_id is None: # Pages without rules cannot break the order.
+            continue
+        if must_follow[page_id] & seen: # A page that must follow this one was already printed.
+            return False
+        seen |= 1 << page_id
+    return True
+
+def reorder_update(rule_index, update_list):
+    """
+    Sorts the update list using the rules as a comparator.
+
+    :param rule_index: Tuple returned by compile_rules.
+    :param update_list: List of pages to reorder.
+    :return: The reordered list, or False if the rules cannot order the pages.
+    """
+
+    page_ids, must_follow = rule_index
+
+    def compare(a, b):
+        id_a, id_b = page_ids.get(a), page_ids.get(b)
+        if id_a is None or id_b is None: # No rule relates the pages.
+            return 0
+        if must_follow[id_a] >> id_b & 1: # a must come before b.
+            return -1
+        if must_follow[id_b] >> id_a & 1: # b must come before a.
+            return 1
+        return 0
+
+    sorted_list = sorted(update_list, key=cmp_to_key(compare))
+    if is_update_valid(rule_index, sorted_list):
+        return sorted_list
+
+    # The comparator is only reliable when every pair of pages has a rule; otherwise fall back to a topological sort.
+    remaining = list(update_list)
+    sorted_list = []
+    while remaining:
+        later = 0 # Bitset of the pages that must follow some remaining page.
+        for page in remaining:
+            if page in page_ids:
+                later |= must_follow[page_ids[page]]
+        ready = next((page for page in remaining if page not in page_ids or not later >> page_ids[page] & 1), None)
+        if ready is None: # The rules form a cycle, so the pages cannot be ordered.
+            return False
+        remaining.remove(ready)
+        sorted_list.append(ready)
+    return sorted_list
+
+def check_update(rule_index, update_list):
+    """
+    Validates the update list against a compiled rule index.
+
+    Results match is_order_valid only when every pair of pages in the update has a rule, as in the puzzle.
+    Otherwise an update is valid when it violates no rule pair, and a reordered update may be a different
+    valid order than the one is_order_valid returns.
+
+    :param rule_index: Tuple returned by compile_rules.
+    :param update_list: List of pages to validate.
+    :return:
+        - True if the update list respects the rules.
+        - False if the list cannot be reordered to respect the rules.
+        - Reordered list if the order can be corrected.
+    """
+
+    if is_update_valid(rule_index, update_list):
+        return True
+    return reorder_update(rule_index, update_list)
 
 def correctly_ordered_and_reordered_sum(page_ordering, page_updates):
     """
@@ -131,6 +249,78 @@ def correctly_ordered_and_reordered_sum(page_ordering, page_updates):
 
     return valid_sum, reordered_sum
 
+def correctly_ordered_and_reordered_sum_indexed(page_ordering, page_updates):
+    """
+    Like correctly_ordered_and_reordered_sum, but compiles the rules once for all updates.
+    The sums are the same when the rules relate every pair of pages in each update (see check_update).
+    """
+
+    rule_index = compile_rules(page_ordering)
+    valid_sum = 0 # Sum for correctly ordered updates.
+    reordered_sum = 0 # Sum for reordered updates.
+
+    for update_list in page_updates:
+        result = check_update(rule_index, update_list)
+
+        if result is True: # If the update list is valid as is.
+            valid_sum += update_list[len(update_list) // 2]
+        elif result is not False: # If the list could be reordered.
+            reordered_sum += result[len(result) // 2]
+
+    return valid_sum, reordered_sum
+
+def stream_updates(rule_index, lines):
+    """
+    Validates updates one line at a time against a compiled rule index.
+    Lines without ',' (rules, blank lines) are skipped, so a whole puzzle file can be streamed.
+
+    :param rule_index: Tuple returned by compile_rules.
+    :param lines: Iterable of text lines, e.g. an open file or sys.stdin.
+    :return: Generator of (status, middle_page) tuples, where status is "valid" or "reordered";
+             updates that cannot be ordered are skipped.
+    """
+
+    for line in lines:
+        line = line.strip()
+        if ',' not in line: # Not an update line.
+            continue
+
+        update_list = [int(x) for x in line.split(',')]
+        result = check_update(rule_index, update_list)
+        if result is True:
+            yield "valid", update_list[len(update_list) // 2]
+        elif result is not False:
+            yield "reordered", result[len(result) // 2]
+
+def stream_file(rule_index, filename="-"):
+    """
+    Streams the updates of a file, or of standard input when filename is "-", against a rule index.
+
+    :param rule_index: Tuple returned by compile_rules.
+    :param filename: Name of the file to read, or "-" for standard input.
+    :return: Generator of (status, middle_page) tuples (see stream_updates).
+    """
+
+    if filename == "-":
+        yield from stream_updates(rule_index, sys.stdin)
+        return
+    with open(filename, "r") as file: # Open the file in read mode.
+        yield from stream_updates(rule_index, file)
+
+def stream_sums(rule_index, filename="-"):
+    """
+    Sums the middle pages of valid and reordered updates while keeping only the running totals in memory.
+
+    :param rule_index: Tuple returned by compile_rules.
+    :param filename: Name of the file to read, or "-" for standard input.
+    :return: A tuple (valid_sum, reordered_sum).
+    """
+
+    sums = {"valid": 0, "reordered": 0}
+    for status, middle_page in stream_file(rule_index, filename):
+        sums[status] += middle_page
+    return sums["valid"], sums["reordered"]
+
 def main():
     """
     Main function to read data, validate orders, and log results.
@@ -138,7 +328,7 @@ def main():
 
     filename_path = os.path.join(__location__, "day5_test.txt") # Construct the file path using the script's location.
     page_ordering, page_updates = read_file(filename_path) # Read the page ordering and updates from the file.
-    valid_sum, reordered_sum = correctly_ordered_and_reordered_sum(page_ordering, page_updates) # Calculate the sums of middle numbers for valid and reordered updates.
+    valid_sum, reordered_sum = correctly_ordered_and_reordered_sum_indexed(page_ordering, page_updates) # Calculate the sums of middle numbers for valid and reordered updates.
 
     # Log the results.
     logging.info(f"Sum of middle page numbers from correctly ordered updates: {valid_sum}.")
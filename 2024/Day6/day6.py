@@ -1,4 +1,6 @@
 import logging # For logging events
+from bisect import bisect_left, bisect_right # For finding the next obstacle in a sorted row or column.
+from concurrent.futures import ProcessPoolExecutor # For trying obstruction candidates in parallel.
 import os # Provides a way to interact with the operating system, such as file and directory oprerations
 import numpy as np # For multi-dimensional arrays and mathematical operations.
 
@@ -105,6 +107,160 @@ def patrol_path(grid, add_obstacle_pos=None):
 
     return sum_visited_positions, False 
 
+# Directions as indexes, ordered so that turning right is (direction + 1) % 4.
+DIRECTION_INDEX = {"^": 0, ">": 1, "v": 2, "<": 3}
+STEPS = [(-1, 0), (0, 1), (1, 0), (0, -1)] # (row change, column change) for each direction index.
+
+def build_jump_tables(grid):
+    """
+    Precomputes the sorted obstacle positions of every row and column.
+
+    :param grid: The grid representing the patrol area.
+    :return: A tuple (row_obstacles, col_obstacles, shape), where row_obstacles[row] lists the obstacle
+             columns of that row and col_obstacles[col] lists the obstacle rows of that column, both sorted.
+    """
+    rows, cols = grid.shape
+    row_obstacles = [[] for _ in range(rows)]
+    col_obstacles = [[] for _ in range(cols)]
+
+    obstacle_rows, obstacle_cols = np.nonzero(grid == "#") # Row-major order keeps both lists sorted.
+    for row, col in zip(obstacle_rows.tolist(), obstacle_cols.tolist()):
+        row_obstacles[row].append(col)
+        col_obstacles[col].append(row)
+
+    return row_obstacles, col_obstacles, (rows, cols)
+
+def find_guard(grid):
+    """
+    Locates the guard on the grid.
+
+    :param grid: The grid representing the patrol area.
+    :return: A tuple ((row, col), direction) with the direction as an index of DIRECTION_INDEX.
+    """
+    row, col = np.argwhere(np.isin(grid, list(DIRECTION_INDEX)))[0]
+    return (int(row), int(col)), DIRECTION_INDEX[grid[row, col]]
+
+def next_stop(tables, position, direction, extra_obstacle=None):
+    """
+    Jumps from a position to the last free cell before the next obstacle in the given direction.
+
+    :param tables: Tuple returned by build_jump_tables.
+    :param position: Current (row, col) position.
+    :param direction: Direction index (see DIRECTION_INDEX).
+    :param extra_obstacle: Optional (row, col) of an obstacle that is not on the grid.
+    :return: A tuple (stop, leaves) with the last cell reached and whether the guard leaves the grid there.
+    """
+    row_obstacles, col_obstacles, (rows, cols) = tables
+    row, col = position
+    vertical = direction % 2 == 0 # Up or down.
+    line = col_obstacles[col] if vertical else row_obstacles[row] # Obstacles along the movement line.
+    along, limit = (row, rows) if vertical else (col, cols) # Coordinate that changes while moving.
+
+    extra_along = None # Coordinate of the extra obstacle if it lies on the movement line.
+    if extra_obstacle is not None and extra_obstacle[1 if vertical else 0] == (col if vertical else row):
+        extra_along = extra_obstacle[0 if vertical else 1]
+
+    if direction in (1, 2): # Moving towards larger coordinates.
+        index = bisect_right(line, along)
+        blocker = line[index] if index < len(line) else limit
+        if extra_along is not None and along < extra_along < blocker:
+            blocker = extra_along
+        stop, leaves = blocker - 1, blocker == limit
+    else: # Moving towards smaller coordinates.
+        index = bisect_left(line, along) - 1
+        blocker = line[index] if index >= 0 else -1
+        if extra_along is not None and blocker < extra_along < along:
+            blocker = extra_along
+        stop, leaves = blocker + 1, blocker == -1
+
+    return ((stop, col) if vertical else (row, stop)), leaves
+
+class VisitedStates:
+    """
+    Compact set of (row, col, direction) states backed by a bitset.
+
+    State (row, col, direction) is bit (row * cols + col) * 4 + direction, so the store costs half a byte
+    per grid cell. Only the bytes touched since the last reset are cleared, so resetting between trials
+    costs as much as the trial recorded, never the size of the grid.
+    """
+
+    def __init__(self, rows, cols):
+        self.cols = cols
+        self.bits = bytearray((rows * cols * 4 + 7) // 8) # One bit per state.
+        self.touched = [] # Indexes of the bytes with at least one bit set.
+
+    def add(self, row, col, direction):
+        """
+        Records a state.
+
+        :return: True if the state is new, False if it was already recorded.
+        """
+        index = (row * self.cols + col) * 4 + direction
+        byte, mask = index >> 3, 1 << (index & 7)
+        value = self.bits[byte]
+        if value & mask: # Already recorded.
+            return False
+        if not value: # First bit set in this byte.
+            self.touched.append(byte)
+        self.bits[byte] = value | mask
+        return True
+
+    def reset(self):
+        """
+        Forgets every recorded state.
+        """
+        for byte in self.touched:
+            self.bits[byte] = 0
+        self.touched.clear()
+
+def simulate_jumps(tables, position, direction, extra_obstacle=None, segments=None, visited_states=None):
+    """
+    Simulates the patrol by jumping from turn to turn.
+    Loops are detected on the (turn cell, direction) states only.
+
+    :param tables: Tuple returned by build_jump_tables.
+    :param position: Starting (row, col) position.
+    :param direction: Starting direction index.
+    :param extra_obstacle: Optional (row, col) of an obstacle that is not on the grid.
+    :param segments: Optional list to which every (start, stop) segment walked is appended.
+    :param visited_states: Optional VisitedStates store reused between trials; it is reset before the simulation.
+    :return: True if the guard gets stuck in a loop, False if the guard leaves the grid.
+    """
+    if visited_states is None:
+        visited_states = VisitedStates(*tables[2])
+    visited_states.reset() # Visited (turn cell, direction) states.
+
+    while True:
+        stop, leaves = next_stop(tables, position, direction, extra_obstacle)
+        if segments is not None:
+            segments.append((position, stop))
+        if leaves: # The guard leaves the grid.
+            return False
+
+        if not visited_states.add(stop[0], stop[1], direction): # The same turn was already taken, so the guard is in a loop.
+            return True
+
+        position, direction = stop, (direction + 1) % 4 # Turn right at the obstacle.
+
+def patrol_jumps(grid):
+    """
+    Jump-table version of patrol_path.
+
+    :param grid: The grid representing the patrol area.
+    :return: A tuple with the count of distinct visited positions and a flag indicating if a loop was detected.
+    """
+    tables = build_jump_tables(grid)
+    position, direction = find_guard(grid)
+
+    segments = []
+    is_loop = simulate_jumps(tables, position, direction, segments=segments)
+
+    visited = np.zeros(grid.shape, dtype=bool) # Cells covered by the walked segments.
+    for (start_row, start_col), (stop_row, stop_col) in segments:
+        visited[min(start_row, stop_row):max(start_row, stop_row) + 1, min(start_col, stop_col):max(start_col, stop_col) + 1] = True
+
+    return int(np.count_nonzero(visited)), is_loop
+
 def find_stuck_positions(grid):
     """
     Finds positions where adding an obstacle causes the guard to get stuck in a loop.
@@ -125,18 +281,90 @@ def find_stuck_positions(grid):
 
     return stuck_positions
 
+def path_candidates(tables, position, direction):
+    """
+    Lists the cells of the original route where an obstruction could change the patrol.
+
+    Each cell is paired with the state just before the guard first enters it, so a trial can resume
+    from there: until that moment the route is the same with or without the obstruction.
+
+    :param tables: Tuple returned by build_jump_tables.
+    :param position: Starting (row, col) position of the guard.
+    :param direction: Starting direction index.
+    :return: List of (cell, previous_position, direction) tuples, one per distinct cell of the route except the start.
+    """
+    segments = []
+    simulate_jumps(tables, position, direction, segments=segments)
+
+    seen = {position} # The guard is standing on the start cell, so it cannot be obstructed.
+    candidates = []
+    for turns, (start, stop) in enumerate(segments):
+        segment_direction = (direction + turns) % 4 # Every segment starts with a right turn.
+        row_step, col_step = STEPS[segment_direction]
+        previous = start
+        while previous != stop: # Walk the segment cell by cell.
+            cell = (previous[0] + row_step, previous[1] + col_step)
+            if cell not in seen:
+                seen.add(cell)
+                candidates.append((cell, previous, segment_direction))
+            previous = cell
+
+    return candidates
+
+worker_tables = None # Jump tables shared by the obstruction trials of a worker process.
+worker_states = None # Visited-state store reused by the obstruction trials of a worker process.
+
+def init_worker(tables):
+    """
+    Stores the jump tables in a worker process so they are sent once instead of with every chunk,
+    and allocates the visited-state store once for all the trials of the worker.
+    """
+    global worker_tables, worker_states
+    worker_tables = tables
+    worker_states = VisitedStates(*tables[2])
+
+def count_loops(candidates):
+    """
+    Counts the candidates of a chunk that trap the guard in a loop.
+
+    :param candidates: List of (cell, previous_position, direction) tuples (see path_candidates).
+    :return: Number of candidate cells causing a loop.
+    """
+    return sum(
+        simulate_jumps(worker_tables, previous, direction, extra_obstacle=cell, visited_states=worker_states)
+        for cell, previous, direction in candidates
+    )
+
+def find_stuck_positions_parallel(grid, workers=None, chunk_size=256):
+    """
+    Finds positions where adding an obstacle causes the guard to get stuck in a loop,
+    trying only the cells of the original route and spreading the trials over a process pool.
+
+    :param grid: The grid representing the lab.
+    :param workers: Number of worker processes (defaults to the number of CPUs).
+    :param chunk_size: Number of candidates per task.
+    :return: Number of positions causing loops when obstructed.
+    """
+    tables = build_jump_tables(grid)
+    position, direction = find_guard(grid)
+    candidates = path_candidates(tables, position, direction)
+    chunks = [candidates[start:start + chunk_size] for start in range(0, len(candidates), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(tables,)) as executor:
+        return sum(executor.map(count_loops, chunks))
+
 def main():
     filename_path = os.path.join(__location__,"day6_test.txt") # Define the filename path using the script's location.
 
     grid = read_file(filename_path) # Read the data from the file.
 
-    visited_positions_count, is_loop_detected = patrol_path(grid.copy()) # Simulate the patrol path and log the results.
+    visited_positions_count, is_loop_detected = patrol_jumps(grid) # Simulate the patrol path and log the results.
     logging.info(f"The guard visited {visited_positions_count} positions before leaving the mapped area.")
     if is_loop_detected:
         logging.info("A loop was detected during the patrol.")
 
     # Find positions that would cause a loop if obstructed.
-    stuck_positions = find_stuck_positions(grid)
+    stuck_positions = find_stuck_positions_parallel(grid)
     logging.info(f"The guard would get stuck in a loop if obstacles were added at {stuck_positions} positions.")
 
 # Entry point of the script.                
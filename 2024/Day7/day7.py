@@ -1,6 +1,9 @@
 import logging # For logging events.
+from bisect import bisect_right # For looking up the number of digits in the powers of ten table.
+from concurrent.futures import ProcessPoolExecutor, as_completed # For solving chunks of equations in parallel.
 import os # Provides a way to interact with the operating system, such as file and directory operations.
 from itertools import product # Utilities for Cartesian products.
+import time # For timing each chunk of equations.
 
 logging.getLogger('urllib3').setLevel(logging.INFO) # Set up logging events.
 
@@ -80,10 +83,121 @@ def calibration(test_values, numbers):
                 break # Stop checking further combinations for this test value.
     return total
 
+POWERS_OF_TEN = [10 ** k for k in range(64)] # Precomputed powers of ten for the concatenation operator.
+
+def concat_shift(number):
+    """
+    Returns the power of ten by which a value is shifted when number is concatenated after it.
+    """
+    return POWERS_OF_TEN[bisect_right(POWERS_OF_TEN, max(number, 1))] # 10 ** (number of digits of number).
+
+def can_solve(test_value, nums, operators=("+", "*", "||")):
+    """
+    Checks if the numbers can produce the test value, working backwards from the last number.
+
+    Each operator is undone on the target: '+' by subtraction, '*' by exact division and '||' by checking
+    that the target ends with the digits of the number. Branches that cannot be undone are pruned whole.
+    The numbers are expected to be non-negative, as in the puzzle input.
+
+    :param test_value: Target value to achieve.
+    :param nums: List of non-negative integers to be evaluated left to right.
+    :param operators: Operators allowed between the numbers ("+", "*" and/or "||").
+    :return: True if some combination of operators produces the test value.
+    """
+
+    unknown = set(operators) - {"+", "*", "||"}
+    if unknown:
+        raise ValueError(f"Unsupported operators: {sorted(unknown)}")
+    use_add, use_mul, use_concat = "+" in operators, "*" in operators, "||" in operators
+    shifts = [concat_shift(number) for number in nums] if use_concat else None
+
+    def solve(target, index):
+        if index == 0: # Only the first number is left.
+            return target == nums[0]
+        number = nums[index]
+        if use_add and target >= number and solve(target - number, index - 1): # Undo '+'.
+            return True
+        if use_mul:
+            if number == 0: # Anything times zero is zero.
+                if target == 0:
+                    return True
+            elif target % number == 0 and solve(target // number, index - 1): # Undo '*'.
+                return True
+        if use_concat:
+            shift = shifts[index]
+            if target % shift == number and solve(target // shift, index - 1): # Undo '||'.
+                return True
+        return False
+
+    return bool(nums) and solve(test_value, len(nums) - 1)
+
+def calibration_backward(test_values, numbers, operators=("+", "*", "||")):
+    """
+    Same as calibration, using the backward solver and a configurable operator set.
+
+    :param test_values: List of target values to achieve.
+    :param numbers: List of lists of numbers to use in the equations.
+    :param operators: Operators allowed between the numbers.
+    :return: The total sum of the test values for which a valid equation exists.
+    """
+
+    return sum(test_value for test_value, nums in zip(test_values, numbers) if can_solve(test_value, nums, operators))
+
+def solve_chunk(task):
+    """
+    Solves one chunk of equations in a worker process.
+
+    :param task: Tuple (chunk_index, equations, operators) where equations is a list of (test_value, nums) pairs.
+    :return: Tuple (chunk_index, chunk_total, elapsed) with the sum of the solvable test values and the time spent in seconds.
+    """
+
+    chunk_index, equations, operators = task
+    start = time.perf_counter()
+    chunk_total = sum(test_value for test_value, nums in equations if can_solve(test_value, nums, operators))
+    return chunk_index, chunk_total, time.perf_counter() - start
+
+def iter_calibration_chunks(test_values, numbers, operators=("+", "*", "||"), workers=None, chunk_size=1000):
+    """
+    Solves the equations in chunks on a process pool and yields each chunk's result as soon as it finishes.
+
+    :param test_values: List of target values to achieve.
+    :param numbers: List of lists of numbers to use in the equations.
+    :param operators: Operators allowed between the numbers.
+    :param workers: Number of worker processes (defaults to the number of CPUs).
+    :param chunk_size: Number of equations per chunk.
+    :return: Generator of (chunk_index, chunk_total, elapsed) tuples in completion order.
+    """
+
+    equations = list(zip(test_values, numbers))
+    tasks = [(index, equations[start:start + chunk_size], operators) for index, start in enumerate(range(0, len(equations), chunk_size))]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(solve_chunk, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+def calibration_parallel(test_values, numbers, operators=("+", "*", "||"), workers=None, chunk_size=1000):
+    """
+    Same as calibration_backward, spreading the equations over a process pool and logging the timing of each chunk.
+
+    :param test_values: List of target values to achieve.
+    :param numbers: List of lists of numbers to use in the equations.
+    :param operators: Operators allowed between the numbers.
+    :param workers: Number of worker processes (defaults to the number of CPUs).
+    :param chunk_size: Number of equations per chunk.
+    :return: The total sum of the test values for which a valid equation exists.
+    """
+
+    total = 0
+    for chunk_index, chunk_total, elapsed in iter_calibration_chunks(test_values, numbers, operators, workers, chunk_size):
+        logging.info(f"Chunk {chunk_index} solved in {elapsed:.3f} s, partial result {chunk_total}.")
+        total += chunk_total
+    return total
+
 def main():
     filename_path = os.path.join(__location__, "day7_test.txt") # Define the filename using the script's location.
     test_values, numbers = read_file(filename_path) # Read the test values and numbers from the file.
-    result = calibration(test_values, numbers) # Perform the calibration to find the total sum of valid test values.
+    result = calibration_backward(test_values, numbers) # Perform the calibration to find the total sum of valid test values.
     logging.info(f"Total calibration result is {result}.") # Log the total calibration result.
 
 # Entry point of the script.    
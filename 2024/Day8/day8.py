@@ -22,13 +22,64 @@ def read_file(filename):
         grid_array = np.array(grid)
     return grid_array
 
+def group_antennas(grid):
+    """
+    Groups the antenna coordinates by frequency in one pass over the grid.
+
+    :param grid: 2D NumPy array of characters; letters and digits are antennas.
+    :return: Dictionary mapping each frequency to an (n, 2) int array of (row, col) coordinates.
+    """
+    coords = np.argwhere(np.char.isalnum(grid)) # Coordinates of all antennas in row-major order.
+    frequencies = grid[coords[:, 0], coords[:, 1]] # Frequency of each antenna.
+
+    order = np.argsort(frequencies, kind="stable") # Bring antennas of the same frequency together.
+    frequencies, coords = frequencies[order], coords[order]
+    unique, starts = np.unique(frequencies, return_index=True)
+    return {str(frequency): group for frequency, group in zip(unique, np.split(coords, starts[1:]))}
+
+def antinodes_for_frequency(positions, shape, resonant=False):
+    """
+    Generates the antinodes of all antenna pairs of one frequency with broadcasting.
+
+    :param positions: (n, 2) int array of antenna coordinates.
+    :param shape: Shape (rows, cols) of the grid.
+    :param resonant: If False, only the antinode one step beyond each antenna of a pair is produced;
+                     if True, every grid position in line with the pair at a multiple of their distance is.
+    :return: (m, 2) int array of the antinodes inside the grid (may contain duplicates).
+    """
+    if len(positions) < 2: # A single antenna has no pairs.
+        return np.empty((0, 2), dtype=np.int64)
+
+    deltas = positions[:, None, :] - positions[None, :, :] # deltas[i, j] = p_i - p_j.
+    pairs = ~np.eye(len(positions), dtype=bool) # Every ordered pair of different antennas.
+    origins, deltas = np.broadcast_to(positions[:, None, :], deltas.shape)[pairs], deltas[pairs]
+
+    steps = np.arange(max(shape) + 1)[:, None, None] if resonant else np.array([[[1]]]) # Multiples of the distance.
+    antinodes = (origins[None, :, :] + steps * deltas[None, :, :]).reshape(-1, 2)
+
+    inside = (antinodes >= 0).all(axis=1) & (antinodes[:, 0] < shape[0]) & (antinodes[:, 1] < shape[1])
+    return antinodes[inside]
+
+def count_antinodes(grid, resonant=False):
+    """
+    Counts the unique grid positions containing an antinode.
+
+    :param grid: 2D NumPy array of characters.
+    :param resonant: Whether to include resonant harmonics (see antinodes_for_frequency).
+    :return: Number of unique antinode positions.
+    """
+    marked = np.zeros(grid.size, dtype=bool) # Flat grid of antinode positions.
+    for positions in group_antennas(grid).values():
+        antinodes = antinodes_for_frequency(positions, grid.shape, resonant)
+        marked[antinodes[:, 0] * grid.shape[1] + antinodes[:, 1]] = True
+    return int(np.count_nonzero(marked))
+
 def main():
     filename_path = os.path.join(__location__, "day8_test.txt") # Define the filename using the script's location. 
 
-    test = read_file(filename_path) 
-    print(test)
-    #result =
-    # logging.info(f"{}") 
+    grid = read_file(filename_path)
+    logging.info(f"Unique locations containing an antinode: {count_antinodes(grid)}")
+    logging.info(f"Unique locations containing an antinode with resonant harmonics: {count_antinodes(grid, resonant=True)}")
 
 # Entry point of the script.
 if __name__ == "__main__":
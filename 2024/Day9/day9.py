@@ -1,3 +1,5 @@
+from array import array # For compact arrays of span starts, lengths and file IDs.
+import heapq # For keeping the free spans of each length ordered by start position.
 import logging # For logging events.
 import os # Provides a way to interact with the operating system, such as file and directory operations.
 
@@ -117,22 +119,143 @@ def calculate_checksum(blocks):
     """
     return sum(pos * file_id for pos, file_id in enumerate(blocks) if file_id is not None)
 
+FREE = -1 # File ID marking a span of free space.
+
+def parse_disk_spans(disk_map):
+    """
+    Parse the disk map string into spans without expanding individual blocks.
+
+    :param disk_map: String containing alternating file sizes and free spaces.
+    :return: Tuple of parallel arrays (starts, lengths, ids) describing each span in disk order;
+             free spans have the id FREE and adjacent free spans are merged.
+    """
+    starts, lengths, ids = array('q'), array('q'), array('q')
+    position = 0
+    file_id = 0
+
+    for i, digit in enumerate(disk_map.strip()):
+        size = int(digit)
+        if size == 0: # Empty spans take no blocks.
+            continue
+
+        if i % 2 == 0: # Even positions are files.
+            starts.append(position)
+            lengths.append(size)
+            ids.append(file_id)
+            file_id += 1
+        elif ids and ids[-1] == FREE: # Free space right after free space (an empty file in between).
+            lengths[-1] += size
+        else: # Odd positions are free space.
+            starts.append(position)
+            lengths.append(size)
+            ids.append(FREE)
+        position += size
+
+    return starts, lengths, ids
+
+def compact_spans_single_block(spans):
+    """
+    Span version of compact_files_single_block: files keep their order and are packed at the start of the disk.
+
+    :param spans: Tuple (starts, lengths, ids) as returned by parse_disk_spans.
+    :return: Tuple (starts, lengths, ids) of the compacted file spans; the free space after them is implicit.
+    """
+    _, lengths, ids = spans
+    new_starts, new_lengths, new_ids = array('q'), array('q'), array('q')
+    position = 0
+
+    for length, file_id in zip(lengths, ids):
+        if file_id == FREE:
+            continue
+        new_starts.append(position) # Place the file right after the previous one.
+        new_lengths.append(length)
+        new_ids.append(file_id)
+        position += length
+
+    return new_starts, new_lengths, new_ids
+
+def compact_spans_whole_file(spans):
+    """
+    Span version of compact_files_whole_file: each file, from the highest ID down, moves to the
+    leftmost free span that fits it and lies before it.
+
+    Free spans of length 1-9 are kept in one min-heap of start positions per length. Longer spans,
+    created by merging free space around empty files, share one extra min-heap of (start, length)
+    entries, since any of them fits every file. The leftmost fitting span is the smallest top among
+    at most ten heaps, whatever the size of the disk.
+
+    :param spans: Tuple (starts, lengths, ids) as returned by parse_disk_spans.
+    :return: Tuple (starts, lengths, ids) of the compacted file spans; the free space is implicit.
+    """
+    starts, lengths, ids = spans
+    free_heaps = [[] for _ in range(10)] # free_heaps[length] holds the starts of free spans of that length (1-9).
+    long_heap = [] # (start, length) of the free spans longer than 9.
+
+    def add_free(start, length):
+        if length > 9:
+            heapq.heappush(long_heap, (start, length))
+        elif length > 0:
+            heapq.heappush(free_heaps[length], start)
+
+    for start, length, file_id in zip(starts, lengths, ids):
+        if file_id == FREE:
+            add_free(start, length)
+    files = [i for i, file_id in enumerate(ids) if file_id != FREE] # Indexes of the file spans, in ID order.
+
+    new_starts = array('q', (starts[i] for i in files))
+    new_lengths = array('q', (lengths[i] for i in files))
+    new_ids = array('q', (ids[i] for i in files))
+
+    for index in range(len(new_ids) - 1, -1, -1): # Highest file ID first.
+        file_start, file_length = new_starts[index], new_lengths[index]
+
+        best_length = None # Length of the bucket holding the leftmost fitting free span (None for the long heap).
+        best_start = long_heap[0][0] if long_heap else file_start # Long spans fit every file.
+        for length in range(file_length, 10):
+            heap = free_heaps[length]
+            if heap and heap[0] < best_start:
+                best_length, best_start = length, heap[0]
+        if best_start >= file_start: # No free span to the left can hold the file.
+            continue
+
+        if best_length is None:
+            free_start, free_length = heapq.heappop(long_heap)
+        else:
+            free_start, free_length = heapq.heappop(free_heaps[best_length]), best_length
+        new_starts[index] = free_start # Move the file to the free span.
+        add_free(free_start + file_length, free_length - file_length) # The rest of the span stays free.
+
+    return new_starts, new_lengths, new_ids
+
+def calculate_span_checksum(spans):
+    """
+    Calculate the checksum from spans, using the arithmetic series sum of the positions of each file span.
+
+    :param spans: Tuple (starts, lengths, ids).
+    :return: Integer checksum value.
+    """
+    checksum = 0
+    for start, length, file_id in zip(*spans):
+        if file_id != FREE:
+            checksum += file_id * (length * start + length * (length - 1) // 2) # file_id * (start + ... + start + length - 1)
+    return checksum
+
 def main():
     """
     Main function to process the disk map and compute checksums for different compaction methods.
     """
     filename_path = os.path.join(__location__, "day9.txt") # Define the filename using the script's location.
     disk_map = read_file(filename_path) # Read the disk map from the file.
-    blocks = parse_disk_map(disk_map) # Parse the disk map into blocks.
+    spans = parse_disk_spans(disk_map) # Parse the disk map into spans.
 
     # Perform single-block compaction and calculate its checksum.
-    compacted_single_block = compact_files_single_block(blocks)
-    checksum_part1 = calculate_checksum(compacted_single_block)
+    compacted_single_block = compact_spans_single_block(spans)
+    checksum_part1 = calculate_span_checksum(compacted_single_block)
     logging.info(f"The resulting filesystem checksum for part 1 is: {checksum_part1}.")
 
     # Perform whole-file compaction and calculate its checksum. 
-    compacted_whole_file = compact_files_whole_file(blocks)
-    checksum_part2 = calculate_checksum(compacted_whole_file)
+    compacted_whole_file = compact_spans_whole_file(spans)
+    checksum_part2 = calculate_span_checksum(compacted_whole_file)
     logging.info(f"The resulting filesystem checksum for part 2 is: {checksum_part2}.")
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import logging # For logging events
+import numpy as np # For vectorized dial simulation.
 import os # Provides a way to interact with the operating system, such as file and directory operations. 
 
 # ------------------ Logging ------------------
@@ -95,6 +96,93 @@ def count_zero_all_clicks(rotations: list[str], start_position: int, dial_size:
 
     return zero_hits
 
+# ------------------ Vectorized ------------------
+
+def parse_rotations(rotations: list[str]) -> np.ndarray:
+    """
+    Parse rotations like 'L68' or 'R10' into signed steps (left negative, right positive).
+    """
+
+    directions = np.array([rotation[0] for rotation in rotations])
+    steps = np.array([int(rotation[1:]) for rotation in rotations], dtype=np.int64)
+    signs = np.where(directions == "L", -1, np.where(directions == "R", 1, 0)) # Unknown directions do not move.
+    return signs * steps
+
+def count_zero_chunk(steps: np.ndarray, positions: np.ndarray, dial_sizes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Part 1 and Part 2 counts for a signed step array, for several dials at once.
+    - Positions are tracked unwrapped with cumsum, so the dial position is the unwrapped one modulo the dial size.
+    - A right rotation from a to b passes 0 once for every multiple of the dial size in (a, b].
+    - A left rotation from a to b passes 0 once for every multiple of the dial size in [b, a).
+    Returns the end-on-zero hits and the click hits of each dial, and the dial positions after the steps.
+    """
+
+    positions = positions[:, None] # One row per dial.
+    dial_sizes = dial_sizes[:, None]
+    after = positions + np.cumsum(steps, dtype=np.int64)[None, :]
+    before = np.concatenate((positions, after[:, :-1]), axis=1)
+
+    end_hits = np.count_nonzero(after % dial_sizes == 0, axis=1)
+
+    right_hits = after // dial_sizes - before // dial_sizes
+    left_hits = (before - 1) // dial_sizes - (after - 1) // dial_sizes
+    click_hits = np.where(steps > 0, right_hits, np.where(steps < 0, left_hits, 0)).sum(axis=1)
+
+    final_positions = (after[:, -1] if len(steps) else positions[:, 0]) % dial_sizes[:, 0]
+    return end_hits, click_hits, final_positions
+
+def count_zero_vectorized(steps: np.ndarray, start_position: int, dial_size: int) -> tuple[int, int]:
+    """
+    Part 1 and Part 2 for a signed step array at once.
+    """
+
+    end_hits, click_hits, _ = count_zero_chunk(
+        steps, np.array([start_position], dtype=np.int64), np.array([dial_size], dtype=np.int64)
+    )
+    return int(end_hits[0]), int(click_hits[0])
+
+# ------------------ Streaming ------------------
+
+def iter_rotation_chunks(filename: str, chunk_size: int = 65536):
+    """
+    Stream the rotation file and yield signed step arrays of at most chunk_size rotations.
+    """
+
+    with open(filename, "r") as file:
+        chunk: list[str] = []
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                yield parse_rotations(chunk)
+                chunk = []
+
+        if chunk:
+            yield parse_rotations(chunk)
+
+def count_zero_batch(filename: str, configurations: list[tuple[int, int]], chunk_size: int = 65536) -> list[tuple[int, int]]:
+    """
+    Evaluate the rotation log for many (start_position, dial_size) configurations in one pass over the file.
+    Memory depends on the chunk size and the number of configurations, not on the length of the log.
+    Returns the (Part 1, Part 2) results of each configuration.
+    """
+
+    positions = np.array([start for start, _ in configurations], dtype=np.int64)
+    dial_sizes = np.array([size for _, size in configurations], dtype=np.int64)
+    positions %= dial_sizes
+    end_totals = np.zeros(len(configurations), dtype=np.int64)
+    click_totals = np.zeros(len(configurations), dtype=np.int64)
+
+    for steps in iter_rotation_chunks(filename, chunk_size):
+        end_hits, click_hits, positions = count_zero_chunk(steps, positions, dial_sizes)
+        end_totals += end_hits
+        click_totals += click_hits
+
+    return [(int(end), int(click)) for end, click in zip(end_totals, click_totals)]
+
 def main():
     filename_path = os.path.join(__location__, "day1.txt")
     rotations = read_file(filename_path)
@@ -103,12 +191,12 @@ def main():
     start_position = 50
     dial_size = 100
 
+    part1, part2 = count_zero_vectorized(parse_rotations(rotations), start_position, dial_size)
+
     # ---- Part 1 ----
-    part1 = count_zero_end_positions(rotations, start_position, dial_size)
     logging.info(f"Part 1 result: {part1}")
 
     # ---- Part 2 ----
-    part2 = count_zero_all_clicks(rotations, start_position, dial_size)
     logging.info(f"Part 2 result: {part2}")
 
 if __name__ == "__main__": # Entry point of the script
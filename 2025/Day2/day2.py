@@ -1,5 +1,11 @@
+from array import array # For compact sorted arrays of invalid IDs and their prefix sums.
+from bisect import bisect_left, bisect_right # For range queries on the sorted index.
+import heapq # For merging the sorted series of repeated-block numbers.
 import logging # For logging events
+import mmap # For memory-mapping a saved index.
 import os # Provides a way to interact with the operating system, such as file and directory operations.
+from itertools import combinations # For inclusion-exclusion over block lengths.
+from math import gcd # For the common block length of overlapping series.
 
 # ------------------ Logging ------------------
 
@@ -147,6 +153,205 @@ def find_invalid_ids_part2(id_ranges: list[str]) -> dict[str, list[int]]:
 
         return invalid_by_range
 
+# ------------------ Arithmetic Generator ------------------
+
+def parse_id_range(id_range: str) -> tuple[int, int] | None:
+    """
+    Parse a range like '11-22' into (start, end), or None if the range is rejected.
+    Uses the same rules as find_invalid_ids_part1 / find_invalid_ids_part2.
+    """
+
+    if '-' not in id_range:
+        return None
+    start_str, end_str = id_range.split('-', 1)
+
+    if (len(start_str) > 1 and start_str.startswith('0')) or (len(end_str) > 1 and end_str.startswith('0')):
+        return None
+
+    try:
+        start = int(start_str)
+        end = int(end_str)
+    except ValueError:
+        return None
+
+    if start > end:
+        return None
+    return start, end
+
+def prime_factors(n: int) -> list[int]:
+    """
+    Returns the distinct prime factors of n.
+    """
+
+    factors = []
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            factors.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+def block_lengths(length: int, exactly_twice: bool) -> list[int]:
+    """
+    Block lengths whose repetitions cover every invalid ID with the given number of digits.
+    - Exactly twice: only half the length.
+    - At least twice: length / p for each prime p dividing length; any other block length divides one of these.
+    """
+
+    if length < 2:
+        return []
+    if exactly_twice:
+        return [length // 2] if length % 2 == 0 else []
+    return [length // factor for factor in prime_factors(length)]
+
+def block_series(start: int, end: int, length: int, block_length: int) -> tuple[int, int, int]:
+    """
+    Numbers of the given length made of a block of block_length digits repeated are block * multiplier,
+    with multiplier = (10^length - 1) / (10^block_length - 1).
+    Returns (multiplier, lowest block, highest block) restricted to [start, end]; the block range may be empty.
+    """
+
+    multiplier = (10 ** length - 1) // (10 ** block_length - 1) # e.g. length 6, block 2 -> 10101
+    low = max(10 ** (block_length - 1), -(-start // multiplier)) # No leading zeros, and block * multiplier >= start.
+    high = min(10 ** block_length - 1, end // multiplier)
+    return multiplier, low, high
+
+def iter_repeated_block_ids(start: int, end: int, exactly_twice: bool = False):
+    """
+    Generates the invalid IDs in [start, end] in increasing order without scanning the range.
+    Series of different block lengths overlap (e.g. 111111 is 1, 11 and 111 repeated), so they are merged and deduplicated.
+    """
+
+    for length in range(len(str(max(start, 1))), len(str(end)) + 1):
+        series = []
+        for block_length in block_lengths(length, exactly_twice):
+            multiplier, low, high = block_series(start, end, length, block_length)
+            series.append(range(low * multiplier, high * multiplier + 1, multiplier)) # block * multiplier for each block.
+
+        previous = None
+        for num in heapq.merge(*series):
+            if num != previous:
+                yield num
+            previous = num
+
+def count_and_sum_repeated_block_ids(start: int, end: int, exactly_twice: bool = False) -> tuple[int, int]:
+    """
+    Count and sum the invalid IDs in [start, end] using arithmetic series only.
+    Overlaps between block lengths are removed with inclusion-exclusion: the numbers shared by several
+    block lengths are exactly the repetitions of their greatest common divisor.
+    """
+
+    count = 0
+    total = 0
+
+    for length in range(len(str(max(start, 1))), len(str(end)) + 1):
+        lengths = block_lengths(length, exactly_twice)
+        for size in range(1, len(lengths) + 1):
+            sign = 1 if size % 2 == 1 else -1
+            for subset in combinations(lengths, size):
+                block_length = 0
+                for value in subset:
+                    block_length = gcd(block_length, value)
+
+                multiplier, low, high = block_series(start, end, length, block_length)
+                if low > high:
+                    continue
+                blocks = high - low + 1
+                count += sign * blocks
+                total += sign * multiplier * (low + high) * blocks // 2 # multiplier * (low + ... + high)
+
+    return count, total
+
+def find_invalid_ids_fast(id_ranges: list[str], exactly_twice: bool = False) -> dict[str, list[int]]:
+    """
+    Same result as find_invalid_ids_part1 (exactly_twice=True) or find_invalid_ids_part2 (exactly_twice=False),
+    generating the invalid IDs directly instead of testing every number.
+    """
+
+    invalid_by_range = {}
+
+    for id_range in id_ranges:
+        bounds = parse_id_range(id_range)
+        if bounds is None:
+            continue
+        invalid_by_range[id_range] = list(iter_repeated_block_ids(*bounds, exactly_twice))
+
+    return invalid_by_range
+
+def sum_invalid_ids(id_ranges: list[str], exactly_twice: bool = False) -> int:
+    """
+    Sum of all invalid IDs over the ranges, without generating them.
+    """
+
+    total = 0
+    for id_range in id_ranges:
+        bounds = parse_id_range(id_range)
+        if bounds is not None:
+            total += count_and_sum_repeated_block_ids(*bounds, exactly_twice)[1]
+    return total
+
+# ------------------ Range Query Index ------------------
+
+INT64_MAX = 2 ** 63 - 1
+
+def build_invalid_id_index(max_digits: int, exactly_twice: bool = False) -> tuple[int, array, array]:
+    """
+    Precompute every invalid ID with at most max_digits digits, sorted, with prefix sums.
+    Returns (max_digits, ids, prefix) where prefix[i] is the sum of the first i IDs.
+    """
+
+    ids = array('q', iter_repeated_block_ids(1, 10 ** max_digits - 1, exactly_twice))
+    prefix = array('q', [0])
+    total = 0
+    for num in ids:
+        total += num
+        if total > INT64_MAX:
+            raise ValueError(f"Prefix sums for {max_digits} digits do not fit in 64 bits")
+        prefix.append(total)
+
+    return max_digits, ids, prefix
+
+def query_invalid_id_index(index: tuple, start: int, end: int) -> tuple[int, int]:
+    """
+    Count and sum of the invalid IDs in [start, end], using two binary searches on the index.
+    """
+
+    max_digits, ids, prefix = index
+    if end >= 10 ** max_digits:
+        raise ValueError(f"Range end {end} exceeds the index limit of {max_digits} digits")
+
+    low = bisect_left(ids, start)
+    high = bisect_right(ids, end)
+    return high - low, prefix[high] - prefix[low]
+
+def save_invalid_id_index(index: tuple, filename: str) -> None:
+    """
+    Save the index as raw int64 values: max_digits, number of IDs, the IDs, then the prefix sums.
+    """
+
+    max_digits, ids, prefix = index
+    with open(filename, "wb") as file:
+        file.write(array('q', [max_digits, len(ids)]).tobytes())
+        file.write(ids.tobytes())
+        file.write(prefix.tobytes())
+
+def load_invalid_id_index(filename: str) -> tuple[int, memoryview, memoryview]:
+    """
+    Memory-map an index saved by save_invalid_id_index without reading it into memory.
+    The IDs and prefix sums are returned as int64 memoryviews over the mapped file.
+    """
+
+    with open(filename, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) # Stays open while the views exist.
+
+    values = memoryview(mapped).cast('q')
+    max_digits, count = values[0], values[1]
+    return max_digits, values[2:2 + count], values[2 + count:3 + 2 * count]
+
 # ------------------ Main ------------------
 
 def main():
@@ -155,14 +360,10 @@ def main():
     #logging.info(f"ID ranges: {id_ranges}")
 
     # ---- Part 1 ----
-    invalid_ids_part1 = find_invalid_ids_part1(id_ranges) # {'11-22': [11, 22], '95-115': [99],
-    all_invalid_ids_part1 = [num for ids in invalid_ids_part1.values() for num in ids] # [11, 22, 99, 1010, 1188511885, 222222, 446446, 38593859]
-    logging.info(f"Part 1: Sum of invalid IDs: {sum(all_invalid_ids_part1)}")
+    logging.info(f"Part 1: Sum of invalid IDs: {sum_invalid_ids(id_ranges, exactly_twice=True)}")
 
     # ---- Part 2 ----
-    invalid_ids_part2 = find_invalid_ids_part2(id_ranges)
-    all_invalid_ids_part2 = [num for ids in invalid_ids_part2.values() for num in ids]
-    logging.info(f"Part 2: Sum of invalid IDs: {sum(all_invalid_ids_part2)}")
+    logging.info(f"Part 2: Sum of invalid IDs: {sum_invalid_ids(id_ranges)}")
     
 if __name__ == "__main__":
     main()  
\ No newline at end of file
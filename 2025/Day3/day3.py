@@ -1,4 +1,5 @@
 import logging # For logging events
+import numpy as np # For processing all banks at once.
 import os # Provides a way to interact with the operating system, such as file and directory operations.
 from itertools import combinations
 
@@ -98,6 +99,93 @@ def largest_joltage_k_batteries(banks: list[str], k: int) -> tuple[list[int], in
     
     return results, total_output
 
+# ------------------ Monotonic Stack ------------------
+
+def largest_joltage(bank: str | bytes, k: int) -> int:
+    """
+    Largest k-digit number keeping the order of the digits in the bank, in one pass.
+    - Walk the digits and pop smaller digits from the stack while there are still digits that may be dropped.
+    - ASCII digit bytes compare like the digits themselves, so the bank is never converted digit by digit.
+    """
+
+    digits = bank.encode() if isinstance(bank, str) else bank
+    droppable = len(digits) - k # How many digits may still be left out.
+    stack = bytearray()
+
+    for digit in digits:
+        while droppable and stack and stack[-1] < digit:
+            stack.pop()
+            droppable -= 1
+        stack.append(digit)
+
+    return int(stack[:k])
+
+def largest_joltage_stack(banks: list[str], k: int) -> tuple[list[int], int]:
+    """
+    Same result as largest_joltage_k_batteries using the monotonic stack; Part 1 is k = 2.
+    """
+
+    results: list[int] = []
+    total_output: int = 0
+
+    for bank in banks:
+        if len(bank) < k:
+            logging.warning(f"Bank length ({len(bank)}) is less than k ({k})")
+            continue
+
+        number = largest_joltage(bank, k)
+        results.append(number)
+        total_output += number
+
+    return results, total_output
+
+# ------------------ Vectorized Batch ------------------
+
+def pack_banks(banks: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Load banks into a 2D uint8 matrix of ASCII digits, one row per bank.
+    Shorter banks are padded with 0, which is below every digit byte.
+    Returns the matrix and the length of each bank.
+    """
+
+    lengths = np.array([len(bank) for bank in banks], dtype=np.int64)
+    matrix = np.zeros((len(banks), int(lengths.max(initial=0))), dtype=np.uint8)
+    for row, bank in enumerate(banks):
+        matrix[row, :len(bank)] = np.frombuffer(bank.encode(), dtype=np.uint8)
+    return matrix, lengths
+
+def largest_joltage_batch(banks: list[str], k: int) -> tuple[list[int], int]:
+    """
+    Same result as largest_joltage_k_batteries, selecting the digits of all banks at once.
+    - Step t picks, in every bank, the leftmost maximum of the window [start, length - (k - t)].
+    - The windows of all banks are masked on the padded matrix and resolved with one argmax per step.
+    """
+
+    usable = []
+    for bank in banks:
+        if len(bank) < k:
+            logging.warning(f"Bank length ({len(bank)}) is less than k ({k})")
+            continue
+        usable.append(bank)
+
+    if not usable or k == 0:
+        return [], 0
+
+    matrix, lengths = pack_banks(usable)
+    rows = np.arange(len(usable))
+    columns = np.arange(matrix.shape[1])[None, :]
+    starts = np.zeros(len(usable), dtype=np.int64) # First position each bank may still pick from.
+    selected = np.empty((len(usable), k), dtype=np.uint8) # Chosen ASCII digits per bank.
+
+    for step in range(k):
+        ends = lengths - (k - step) # Last position that leaves enough digits for the remaining picks.
+        window = (columns >= starts[:, None]) & (columns <= ends[:, None])
+        picks = np.argmax(np.where(window, matrix, 0), axis=1) # argmax returns the leftmost maximum.
+        selected[:, step] = matrix[rows, picks]
+        starts = picks + 1
+
+    results = [int(row.tobytes()) for row in selected]
+    return results, sum(results)
 
 def main():
     filename_path = os.path.join(__location__, "day3.txt")
@@ -105,12 +193,12 @@ def main():
     #logging.info(f"Battery banks: {battery_banks}")
 
     # ---- Part 1 ----
-    total_part1 = largest_joltage_two_batteries(battery_banks)
+    _, total_part1 = largest_joltage_stack(battery_banks, 2)
     logging.info(f"Part1: Total output joltage: {total_part1}")
 
     # ---- Part 2 ----
     k_batteries = 12
-    results_part2, total_part2 = largest_joltage_k_batteries(battery_banks, k_batteries)
+    results_part2, total_part2 = largest_joltage_stack(battery_banks, k_batteries)
     logging.info(f"Part 2: Total output joltage: {total_part2}") 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import logging # For logging events
+import mmap # For streaming huge grids from disk.
 import os # Provides a way to interact with the operating system, such as file and directory operations
 import numpy as np
 from scipy.signal import convolve2d
@@ -87,6 +88,141 @@ def total_removable_paper_rolls(grid):
 
     return int(total_removed)
 
+# ------------------ Worklist Peeling ------------------
+
+def total_removable_paper_rolls_worklist(grid, threshold=4, round_log=None):
+    """
+    Part 2 with a worklist instead of a full convolution per round.
+    - Neighbor counts are computed once into an int8 array.
+    - Removing a round of rolls decrements only their eight neighbors; the rolls whose count drops
+      below the threshold form the next round, so each cell is touched a constant number of times.
+    - If round_log is a list, the number of rolls removed in each round is appended to it.
+    """
+
+    arr = np.array(grid)
+    rows, cols = arr.shape
+    width = cols + 2 # The grid is padded by one cell on each side, so neighbors never leave the array.
+
+    rolls = np.zeros((rows + 2, width), dtype=bool)
+    rolls[1:-1, 1:-1] = arr == '@'
+
+    neighbor_kernel = np.array([[1, 1, 1],
+                    [1, 0, 1],
+                    [1, 1, 1]])
+    counts = convolve2d(rolls, neighbor_kernel, mode='same').astype(np.int8).ravel()
+    rolls = rolls.ravel()
+
+    offsets = np.array([-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1])
+    to_remove = np.flatnonzero(rolls & (counts < threshold)) # First round.
+    total_removed = 0
+
+    while len(to_remove):
+        rolls[to_remove] = False
+        total_removed += len(to_remove)
+        if round_log is not None:
+            round_log.append(len(to_remove))
+
+        neighbors = (to_remove[:, None] + offsets[None, :]).ravel()
+        np.subtract.at(counts, neighbors, 1) # A cell next to several removed rolls loses one per roll.
+
+        # Rolls still standing below the threshold must have just crossed it.
+        candidates = np.unique(neighbors)
+        to_remove = candidates[rolls[candidates] & (counts[candidates] < threshold)]
+
+    return int(total_removed)
+
+# ------------------ Bit-Packed Tiles ------------------
+
+POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8) # Set bits in each byte.
+
+def pack_grid_rows(memory, stride, width, row_count, start, stop):
+    """
+    Read rows [start, stop) of the grid file as packed bits (one bit per cell, '@' -> 1).
+    Rows outside the grid come back as zero rows, which serve as the halo at the grid border.
+    """
+
+    packed = np.zeros((stop - start, (width + 7) // 8), dtype=np.uint8)
+    first, last = max(start, 0), min(stop, row_count)
+    if first < last:
+        count = min((last - first) * stride, len(memory) - first * stride) # The last line may have no newline.
+        rows = np.frombuffer(memory, dtype=np.uint8, count=count, offset=first * stride)
+        rows = np.pad(rows, (0, (last - first) * stride - count)).reshape(last - first, stride)
+        packed[first - start:last - start] = np.packbits(rows[:, :width] == ord('@'), axis=1)
+    return packed
+
+def shift_from_west(bits):
+    """
+    Move every bit one column east, so each cell sees its west neighbor.
+    """
+
+    carry = np.zeros_like(bits)
+    carry[:, 1:] = bits[:, :-1] << 7 # Lowest bit of the previous byte.
+    return (bits >> 1) | carry
+
+def shift_from_east(bits):
+    """
+    Move every bit one column west, so each cell sees its east neighbor.
+    """
+
+    carry = np.zeros_like(bits)
+    carry[:, :-1] = bits[:, 1:] >> 7 # Highest bit of the next byte.
+    return (bits << 1) | carry
+
+def count_accessible_bits(tile, threshold=4):
+    """
+    Count the accessible rolls in a packed tile whose first and last rows are halo rows.
+    The eight neighbor bit planes are added with bitwise ripple adders into a 4-bit count per cell.
+    """
+
+    above, center, below = tile[:-2], tile[1:-1], tile[2:]
+    planes = [
+        shift_from_west(above), above, shift_from_east(above),
+        shift_from_west(center), shift_from_east(center),
+        shift_from_west(below), below, shift_from_east(below),
+    ]
+
+    sums = [np.zeros_like(center) for _ in range(4)] # Bits 1, 2, 4 and 8 of the neighbor count.
+    for plane in planes:
+        carry = plane
+        for bit in range(4):
+            sums[bit], carry = sums[bit] ^ carry, sums[bit] & carry
+
+    # Neighbor count below the threshold, evaluated bitwise on the 4-bit count.
+    below_threshold = np.zeros_like(center)
+    for value in range(threshold):
+        match = np.full_like(center, 0xFF)
+        for bit in range(4):
+            match &= sums[bit] if value >> bit & 1 else ~sums[bit]
+        below_threshold |= match
+
+    return int(POPCOUNT[center & below_threshold].sum(dtype=np.int64))
+
+def accessible_paper_rolls_tiled(filename, tile_rows=1024, threshold=4):
+    """
+    Part 1 for grids too large for memory.
+    - The file is memory-mapped and processed in horizontal tiles of tile_rows rows plus one halo row above and below.
+    - Each tile is stored as packed bits, about one bit per cell instead of the 20+ bytes of the array version.
+    """
+
+    if os.path.getsize(filename) == 0: # mmap cannot map an empty file.
+        return 0
+
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+        newline = memory.find(b"\n")
+        stride = newline + 1 if newline >= 0 else len(memory) # Bytes per line, including the line ending.
+        width = newline if newline >= 0 else len(memory)
+        if width > 0 and memory[width - 1:width] == b"\r": # Windows line endings.
+            width -= 1
+        row_count = -(-len(memory) // stride)
+
+        accessible = 0
+        for start in range(0, row_count, tile_rows):
+            stop = min(start + tile_rows, row_count)
+            tile = pack_grid_rows(memory, stride, width, row_count, start - 1, stop + 1) # One halo row on each side.
+            accessible += count_accessible_bits(tile, threshold)
+
+    return accessible
+
 # ------------------ Main ------------------
 
 def main():
@@ -99,7 +235,7 @@ def main():
     logging.info(f"Accessed paper roles by a forklift: {part1}")
 
     # ---- Part 2 ----
-    part2 = total_removable_paper_rolls(paper_grid)
+    part2 = total_removable_paper_rolls_worklist(paper_grid)
     logging.info(f"Paper rolls that can be removed in total by a forklift: {part2}")
 
 if __name__ == "__main__":